@@ -2,6 +2,14 @@
 Authentication and authorization module.
 """
 
+from app.auth.context import access_token_scope, get_cached_access_token
+from app.auth.oidc import CachedOIDCProxy, get_oidc_configuration
 from app.auth.setup import setup_auth
 
-__all__ = ["setup_auth"]
+__all__ = [
+    "CachedOIDCProxy",
+    "access_token_scope",
+    "get_cached_access_token",
+    "get_oidc_configuration",
+    "setup_auth",
+]
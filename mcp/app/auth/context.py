@@ -0,0 +1,54 @@
+"""
+Request-scoped access token cache.
+
+Looking up the access token goes through FastMCP's request context on every
+call. The token cannot change within a request, so it is resolved once and kept
+in a context variable until the request ends.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Final
+
+from fastmcp.server.auth import AccessToken
+from fastmcp.server.dependencies import get_access_token
+
+
+class _Missing:
+    """Marker for a token that has not been looked up in this request yet."""
+
+
+_MISSING: Final = _Missing()
+
+_token_cv: ContextVar[AccessToken | None | _Missing] = ContextVar(
+    "_access_token", default=_MISSING
+)
+
+
+def get_cached_access_token() -> AccessToken | None:
+    """
+    Get the access token of the current request, looking it up once per request.
+
+    Returns:
+        The access token, or None if the request is not authenticated
+    """
+    token = _token_cv.get()
+
+    if isinstance(token, _Missing):
+        token = get_access_token()
+        _token_cv.set(token)
+
+    return token
+
+
+@contextmanager
+def access_token_scope() -> Iterator[None]:
+    """
+    Scope the cached access token to a single request.
+    """
+    cv_token = _token_cv.set(_MISSING)
+    try:
+        yield
+    finally:
+        _token_cv.reset(cv_token)
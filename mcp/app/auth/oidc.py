@@ -0,0 +1,73 @@
+"""
+OIDC provider metadata caching.
+
+The OIDC discovery document (.well-known/openid-configuration) rarely changes,
+so it is fetched once and kept in a process-wide TTL cache. Every server instance
+created within the TTL window reuses the parsed configuration instead of issuing
+another HTTP request against the identity provider.
+"""
+
+import threading
+from typing import override
+
+from cachetools import TTLCache
+from fastmcp.server.auth.oidc_proxy import OIDCConfiguration, OIDCProxy
+from pydantic import AnyHttpUrl
+
+CACHE_EXPIRATION_SECONDS_DEFAULT = 86400
+CACHE_SIZE_DEFAULT = 8
+
+_cache = TTLCache[tuple[str, bool | None], OIDCConfiguration](
+    maxsize=CACHE_SIZE_DEFAULT, ttl=CACHE_EXPIRATION_SECONDS_DEFAULT
+)
+_lock = threading.Lock()
+
+
+def get_oidc_configuration(
+    config_url: AnyHttpUrl | str,
+    *,
+    strict: bool | None = None,
+    timeout_seconds: int | None = None,
+) -> OIDCConfiguration:
+    """
+    Get the OIDC configuration for a config URL, fetching it only on a cache miss.
+
+    The lock is held while fetching so concurrent callers for the same URL wait for
+    the first request instead of all hitting the identity provider.
+
+    Args:
+        config_url: The OIDC configuration URL
+        strict: The strict flag for the configuration
+        timeout_seconds: HTTP request timeout in seconds
+
+    Returns:
+        OIDCConfiguration: The parsed OIDC configuration
+    """
+    key = (str(config_url), strict)
+
+    with _lock:
+        config = _cache.get(key)
+        if config is None:
+            config = OIDCConfiguration.get_oidc_configuration(
+                AnyHttpUrl(key[0]), strict=strict, timeout_seconds=timeout_seconds
+            )
+            _cache[key] = config
+
+    return config
+
+
+class CachedOIDCProxy(OIDCProxy):
+    """
+    OIDCProxy that resolves its discovery document through the process-wide cache.
+    """
+
+    @override
+    def get_oidc_configuration(
+        self,
+        config_url: AnyHttpUrl,
+        strict: bool | None,
+        timeout_seconds: int | None,
+    ) -> OIDCConfiguration:
+        return get_oidc_configuration(
+            config_url, strict=strict, timeout_seconds=timeout_seconds
+        )
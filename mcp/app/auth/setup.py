@@ -3,7 +3,8 @@ Authentication setup and configuration.
 """
 
 from fastmcp.server.auth.oidc_proxy import OIDCProxy
-from app.config import settings
+from app.auth.oidc import CachedOIDCProxy
+from app.config import get_settings
 
 
 def setup_auth() -> OIDCProxy | None:
@@ -13,12 +14,13 @@ def setup_auth() -> OIDCProxy | None:
     Returns:
         OIDCProxy | None: Configured authentication provider
     """
+    settings = get_settings()
 
-    oidc_proxy = OIDCProxy(
-        config_url=str(settings.keycloak_openid_configuration),
+    oidc_proxy = CachedOIDCProxy(
+        config_url=settings.keycloak_config_url_str,
         client_id=settings.keycloak_client_id,
         client_secret=settings.keycloak_client_secret,
-        base_url=str(settings.base_url),
+        base_url=settings.base_url_str,
     )
 
     return oidc_proxy
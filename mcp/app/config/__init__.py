@@ -2,6 +2,6 @@
 Configuration management module.
 """
 
-from app.config.settings import settings
+from app.config.settings import Settings, get_settings
 
-__all__ = ["settings"]
+__all__ = ["Settings", "get_settings"]
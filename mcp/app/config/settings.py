@@ -6,8 +6,15 @@ Environment Loading Priority:
 2. .env file (fallback if system env not set)
 3. Field defaults (used if neither above is set)
 
+Settings are constructed lazily on first access and then reused for the
+lifetime of the process.
+
 Usage:
     # Default: loads from .env if present, otherwise system env vars
+    from app.config.settings import get_settings
+    settings = get_settings()
+
+    # Backwards compatible module attribute (constructed on first access)
     from app.config.settings import settings
 
     # Override env file for testing:
@@ -16,6 +23,8 @@ Usage:
 
 import os
 from enum import Enum
+from functools import cached_property, lru_cache
+from typing import Any
 
 from pydantic import Field, HttpUrl, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -38,6 +47,14 @@ class LogLevel(str, Enum):
     ERROR = "error"
 
 
+class SandboxBackendType(str, Enum):
+    """Container backends the code sandbox can run on."""
+
+    DOCKER = "docker"
+    PODMAN = "podman"
+    KUBERNETES = "kubernetes"
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=os.getenv("ENV_FILE", ".env"),
@@ -88,6 +105,78 @@ class Settings(BaseSettings):
         description="The base URL for the Portfolio API service"
     )
 
+    # Upstream HTTP client settings
+    http_max_connections: int = Field(
+        default=100,
+        ge=1,
+        description="The maximum number of concurrent upstream HTTP connections",
+    )
+
+    http_max_keepalive: int = Field(
+        default=20,
+        ge=0,
+        description="The maximum number of idle upstream HTTP connections kept open",
+    )
+
+    http_keepalive_expiry: float = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds an idle upstream HTTP connection is kept open",
+    )
+
+    http_connect_timeout: float = Field(
+        default=5.0,
+        gt=0,
+        description="Seconds to wait for an upstream connection to be established",
+    )
+
+    http_read_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds to wait for upstream data to be received",
+    )
+
+    http_write_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds to wait for request data to be sent upstream",
+    )
+
+    http_pool_timeout: float = Field(
+        default=5.0,
+        gt=0,
+        description="Seconds to wait for a free connection from the HTTP pool",
+    )
+
+    # Sandbox settings
+    sandbox_backend: SandboxBackendType = Field(
+        default=SandboxBackendType.DOCKER,
+        description="The container backend used to run sandboxed code",
+    )
+
+    sandbox_runtime: str | None = Field(
+        default=None,
+        description="The OCI runtime for sandbox containers, e.g. runsc for gVisor (Docker and Podman only)",
+    )
+
+    sandbox_pool_size: int = Field(
+        default=4,
+        ge=1,
+        description="The maximum number of warm sandbox containers kept in the pool",
+    )
+
+    sandbox_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="The maximum number of sandbox executions running at the same time, and the number of warm containers kept ready for them",
+    )
+
+    sandbox_idle_timeout: float = Field(
+        default=300.0,
+        gt=0,
+        description="Seconds an idle sandbox container is kept before it is recycled",
+    )
+
     @model_validator(mode="after")
     def set_base_url_if_not_provided(self) -> "Settings":
         """Set base_url from host and port if not explicitly provided."""
@@ -96,5 +185,31 @@ class Settings(BaseSettings):
             object.__setattr__(self, "base_url", f"http://{self.host}:{self.port}")
         return self
 
+    # String forms of the URL settings, serialized once instead of on every use
+    @cached_property
+    def base_url_str(self) -> str:
+        """The base URL of the MCP Server as a string."""
+        return str(self.base_url)
+
+    @cached_property
+    def keycloak_config_url_str(self) -> str:
+        """The OpenID Connect configuration URL for Keycloak as a string."""
+        return str(self.keycloak_openid_configuration)
+
+    @cached_property
+    def portfolio_api_url_str(self) -> str:
+        """The base URL for the Portfolio API service as a string."""
+        return str(self.portfolio_api_url)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the application settings, constructing them on first call."""
+    return Settings()  # pyright: ignore[reportCallIssue]
+
 
-settings: Settings = Settings()  # pyright: ignore[reportCallIssue]
+def __getattr__(name: str) -> Any:  # pyright: ignore[reportExplicitAny]
+    """Resolve the legacy `settings` module attribute lazily."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,60 @@
+"""
+Shared upstream HTTP client.
+
+The client is owned by the server lifespan: it is created when the lifespan is
+entered and closed when the last active lifespan exits. Providers keep a
+reference to the holder and read the current client at request time, so a
+server whose lifespan is entered again gets a fresh client, not a closed one.
+"""
+
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+
+import anyio
+import httpx
+
+
+class HttpClientHolder:
+    """
+    Holds the HTTP client for the server's active lifespan(s).
+
+    Args:
+        factory: Builds a new client each time the holder is opened from scratch
+    """
+
+    def __init__(self, factory: Callable[[], httpx.AsyncClient]):
+        self._factory = factory
+        self._client: httpx.AsyncClient | None = None
+        self._users = 0
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The open HTTP client. Only available while a lifespan is active."""
+        if self._client is None:
+            raise RuntimeError(
+                "HTTP client is not open; the server lifespan is not running"
+            )
+        return self._client
+
+    @asynccontextmanager
+    async def open(self) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Open the client for the duration of a lifespan.
+
+        Overlapping lifespans (e.g. several apps built from one server) share a
+        single client, which is closed once the last of them exits.
+        """
+        if self._client is None:
+            self._client = self._factory()
+        self._users += 1
+        client = self._client
+
+        try:
+            yield client
+        finally:
+            self._users -= 1
+            if self._users == 0:
+                self._client = None
+                # Shielded so an exit from a cancelled scope still closes the client
+                with anyio.CancelScope(shield=True):
+                    await client.aclose()
@@ -7,6 +7,8 @@ from app.middleware.authorization import (
     ToolVerifier,
     RoleBasedVerifier,
     ScopeBasedVerifier,
+    ToolTagRequirements,
+    get_tag_requirements,
 )
 
 __all__ = [
@@ -14,4 +16,6 @@ __all__ = [
     "ToolVerifier",
     "RoleBasedVerifier",
     "ScopeBasedVerifier",
+    "ToolTagRequirements",
+    "get_tag_requirements",
 ]
@@ -5,13 +5,51 @@ This middleware checks JWT claims to control access to tools based on user permi
 Can be configured with custom verifier classes to implement any authorization logic.
 """
 
+import weakref
 from abc import ABC, abstractmethod
-from typing import Any, override
+from collections.abc import Callable, Sequence
+from typing import Any, NamedTuple, override
 from fastmcp.tools.tool import Tool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 from fastmcp.exceptions import ToolError
 from fastmcp.server.middleware import Middleware, MiddlewareContext
-from fastmcp.server.dependencies import get_access_token
+from app.auth.context import access_token_scope, get_cached_access_token
+
+
+class ToolTagRequirements(NamedTuple):
+    """Permissions required by a tool, parsed from its tags."""
+
+    roles: frozenset[str]
+    scopes: frozenset[str]
+    role_all: bool
+
+
+_tag_cache: dict[int, tuple[weakref.ref[Tool], ToolTagRequirements]] = {}
+
+
+def get_tag_requirements(tool: Tool) -> ToolTagRequirements:
+    """
+    Get the role and scope requirements declared by a tool's tags.
+
+    Tags are parsed once per tool instance and cached for the lifetime of the tool,
+    so verifiers only do set operations on the hot listing path.
+    """
+    key = id(tool)
+    cached = _tag_cache.get(key)
+    if cached is not None and cached[0]() is tool:
+        return cached[1]
+
+    tags = tool.tags
+    requirements = ToolTagRequirements(
+        roles=frozenset(tag[5:] for tag in tags if tag.startswith("role:")),
+        scopes=frozenset(tag[6:] for tag in tags if tag.startswith("scope:")),
+        role_all="role:all" in tags,
+    )
+    _tag_cache[key] = (
+        weakref.ref(tool, lambda _: _tag_cache.pop(key, None)),
+        requirements,
+    )
+    return requirements
 
 
 class ToolVerifier(BaseModel, ABC):  # pyright: ignore[reportUnsafeMultipleInheritance]
@@ -52,12 +90,31 @@ class ToolVerifier(BaseModel, ABC):  # pyright: ignore[reportUnsafeMultipleInher
         """
         ...
 
+    async def filter(self, claims: dict[str, Any], tools: Sequence[Tool]) -> list[Tool]:  # pyright: ignore[reportExplicitAny]
+        """
+        Filter tools down to the ones the user has access to.
+
+        The default implementation calls verify() for each tool. Override this
+        when a verifier can decide for the whole list at once.
+
+        Args:
+            claims: User claims from the access token
+            tools: The tools being listed
+
+        Returns:
+            The tools the user has access to
+        """
+        return [tool for tool in tools if await self.verify(claims, tool)]
+
 
 class RoleBasedVerifier(ToolVerifier):
     """
     Role-based access control verifier.
     """
 
+    # Re-run _compile_claims_path when claims_path is reassigned
+    model_config = {"validate_assignment": True}
+
     claims_path: str = Field(
         default="realm_access.roles",
         description="Path to roles in JWT claims (dot-separated)",
@@ -65,15 +122,45 @@ class RoleBasedVerifier(ToolVerifier):
     allow_no_role_tags: bool = Field(
         default=False, description="Allow access to tools without role tags"
     )
+    superuser_roles: set[str] = Field(
+        default_factory=set,
+        description="Roles that are granted access to all tools",
+    )
+
+    _path_parts: tuple[str, ...] = PrivateAttr(default=())
+    _extract: Callable[[dict[str, Any]], set[str]] = PrivateAttr()  # pyright: ignore[reportExplicitAny]
+
+    @model_validator(mode="after")
+    def _compile_claims_path(self) -> "RoleBasedVerifier":
+        """Split claims_path once and pick the roles extractor for it."""
+        self._path_parts = tuple(self.claims_path.split("."))
+        self._extract = (
+            self._extract_realm_roles
+            if self._path_parts == ("realm_access", "roles")
+            else self._extract_roles
+        )
+        return self
+
+    def _extract_realm_roles(self, claims: dict[str, Any]) -> set[str]:  # pyright: ignore[reportExplicitAny]
+        """
+        Extract user roles from the default Keycloak `realm_access.roles` claim.
+        """
+        realm_access = claims.get("realm_access")
+        if not isinstance(realm_access, dict):
+            return set()
+
+        roles = realm_access.get("roles")  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+        if isinstance(roles, list):
+            return set(roles)  # pyright: ignore[reportUnknownArgumentType]
+        return set()
 
     def _extract_roles(self, claims: dict[str, Any]) -> set[str]:  # pyright: ignore[reportExplicitAny]
         """
         Extract user roles from JWT claims using the configured path.
         """
-        parts = self.claims_path.split(".")
         current = claims
 
-        for part in parts:
+        for part in self._path_parts:
             if isinstance(current, dict):
                 current = current.get(part, [])  # pyright: ignore[reportAny]
             else:
@@ -83,25 +170,34 @@ class RoleBasedVerifier(ToolVerifier):
             return set(current)  # pyright: ignore[reportUnknownArgumentType]
         return set()
 
+    def _has_access(self, user_roles: set[str], tool: Tool) -> bool:
+        requirements = get_tag_requirements(tool)
+
+        if requirements.role_all:
+            return True
+
+        if not requirements.roles:
+            return self.allow_no_role_tags
+
+        return not requirements.roles.isdisjoint(user_roles)
+
     @override
     async def verify(self, claims: dict[str, Any], tool: Tool) -> bool:  # pyright: ignore[reportExplicitAny]
-        user_roles = self._extract_roles(claims)
-        tool_tags = getattr(tool, "tags", [])
+        user_roles = self._extract(claims)
 
-        if "role:all" in tool_tags:
+        if not self.superuser_roles.isdisjoint(user_roles):
             return True
 
-        role_tags = [tag for tag in tool_tags if tag.startswith("role:")]  # pyright: ignore[reportAny]
+        return self._has_access(user_roles, tool)
 
-        if not role_tags:
-            return self.allow_no_role_tags
+    @override
+    async def filter(self, claims: dict[str, Any], tools: Sequence[Tool]) -> list[Tool]:  # pyright: ignore[reportExplicitAny]
+        user_roles = self._extract(claims)
 
-        for tag in role_tags:  # pyright: ignore[reportAny]
-            required_role: str = tag[5:]  # pyright: ignore[reportAny]
-            if required_role in user_roles:
-                return True
+        if not self.superuser_roles.isdisjoint(user_roles):
+            return list(tools)
 
-        return False
+        return [tool for tool in tools if self._has_access(user_roles, tool)]
 
 
 class ScopeBasedVerifier(ToolVerifier):
@@ -132,6 +228,9 @@ class ScopeBasedVerifier(ToolVerifier):
         ```
     """
 
+    # Re-run _compile_claims_path when claims_path is reassigned
+    model_config = {"validate_assignment": True}
+
     claims_path: str = Field(
         default="scope", description="Path to scopes in JWT claims"
     )
@@ -139,11 +238,36 @@ class ScopeBasedVerifier(ToolVerifier):
         default=False, description="Allow access to tools without scope tags"
     )
 
+    _path_parts: tuple[str, ...] = PrivateAttr(default=())
+    _extract: Callable[[dict[str, Any]], set[str]] = PrivateAttr()  # pyright: ignore[reportExplicitAny]
+
+    @model_validator(mode="after")
+    def _compile_claims_path(self) -> "ScopeBasedVerifier":
+        """Split claims_path once and pick the scopes extractor for it."""
+        self._path_parts = tuple(self.claims_path.split("."))
+        self._extract = (
+            self._extract_top_level_scopes
+            if len(self._path_parts) == 1
+            else self._extract_scopes
+        )
+        return self
+
+    def _extract_top_level_scopes(self, claims: dict[str, Any]) -> set[str]:  # pyright: ignore[reportExplicitAny]
+        """
+        Extract user scopes from a top-level claim such as the standard `scope`.
+        """
+        current = claims.get(self.claims_path, "")  # pyright: ignore[reportAny]
+
+        if isinstance(current, str):
+            return set(current.split()) if current else set()
+        elif isinstance(current, list):
+            return set(current)  # pyright: ignore[reportUnknownArgumentType]
+        return set()
+
     def _extract_scopes(self, claims: dict[str, Any]) -> set[str]:  # pyright: ignore[reportExplicitAny]
-        parts = self.claims_path.split(".")
         current = claims
 
-        for part in parts:
+        for part in self._path_parts:
             if isinstance(current, dict):
                 current = current.get(part, "")  # pyright: ignore[reportAny]
             else:
@@ -157,20 +281,13 @@ class ScopeBasedVerifier(ToolVerifier):
 
     @override
     async def verify(self, claims: dict[str, Any], tool: Tool) -> bool:  # pyright: ignore[reportExplicitAny]
-        user_scopes = self._extract_scopes(claims)
-        tool_tags = getattr(tool, "tags", [])
-
-        scope_tags = [tag for tag in tool_tags if tag.startswith("scope:")]  # pyright: ignore[reportAny]
+        requirements = get_tag_requirements(tool)
 
-        if not scope_tags:
+        if not requirements.scopes:
             return self.allow_no_scope_tags
 
         # Check if user has ALL required scopes (AND logic)
-        required_scopes: list[str] = [
-            tag[6:]
-            for tag in scope_tags  # pyright: ignore[reportAny]
-        ]
-        return all(scope in user_scopes for scope in required_scopes)
+        return requirements.scopes <= self._extract(claims)
 
 
 class AuthorizationMiddleware(Middleware):
@@ -190,12 +307,19 @@ class AuthorizationMiddleware(Middleware):
         self.verifier = verifier
 
     def _get_claims(self) -> dict[str, Any]:  # pyright: ignore[reportExplicitAny]
-        token = get_access_token()
-
-        if token is None:
-            return {}
+        """
+        Get the claims of the current access token, cached for the current request.
+        """
+        token = get_cached_access_token()
+        return token.claims if token is not None else {}
 
-        return token.claims
+    @override
+    async def on_request(self, context: MiddlewareContext, call_next):  # pyright: ignore[reportMissingParameterType]
+        """
+        Scope the cached access token to a single request.
+        """
+        with access_token_scope():
+            return await call_next(context)
 
     @override
     async def on_list_tools(self, context: MiddlewareContext, call_next):  # pyright: ignore[reportMissingParameterType, reportUnknownParameterType]
@@ -207,13 +331,7 @@ class AuthorizationMiddleware(Middleware):
         claims = self._get_claims()
         result = await call_next(context)
 
-        # Filter tools based on verifier
-        filtered_tools = []
-        for tool in result:
-            if await self.verifier.verify(claims, tool):
-                filtered_tools.append(tool)  # pyright: ignore[reportUnknownMemberType]
-
-        return filtered_tools  # pyright: ignore[reportUnknownVariableType]
+        return await self.verifier.filter(claims, result)  # pyright: ignore[reportUnknownArgumentType]
 
     @override
     async def on_call_tool(self, context: MiddlewareContext, call_next):  # pyright: ignore[reportMissingParameterType]
@@ -3,12 +3,16 @@ MCP Resources module.
 """
 
 from fastmcp import FastMCP
+from app.http_client import HttpClientHolder
+from app.resources.portfolio import PortfolioResourceProvider
 
 
-def register_resources(mcp: FastMCP) -> None:
+def register_resources(mcp: FastMCP, http_client: HttpClientHolder) -> None:
     """
     Register all resource providers with the FastMCP server.
-    """
-    from app.resources.portfolio import PortfolioResourceProvider
 
-    PortfolioResourceProvider(mcp)
\ No newline at end of file
+    Args:
+        mcp: The FastMCP server instance
+        http_client: Holder of the shared HTTP client used for upstream requests
+    """
+    PortfolioResourceProvider(mcp, http_client)
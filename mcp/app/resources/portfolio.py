@@ -2,14 +2,80 @@
 Portfolio data resources exposed via MCP.
 """
 
+import asyncio
+import hashlib
 import io
-from fastmcp.server.dependencies import get_access_token
-import httpx
-import pandas as pd
+import weakref
+from functools import cached_property
+from typing import Any
+from cachetools import TTLCache
+from app.auth.context import get_cached_access_token
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 
 from fastmcp import FastMCP
 from fastmcp.exceptions import ResourceError
-from app.config.settings import settings
+from app.config import get_settings
+from app.http_client import HttpClientHolder
+
+CACHE_TTL_SECONDS = 30
+CACHE_SIZE = 64
+
+_NUMBER_PATTERN = r"^[-+]?(\d+(\.\d*)?|\.\d+)([eE][-+]?\d+)?$"
+
+
+def _to_numeric(column: "pa.ChunkedArray[Any]") -> "pa.ChunkedArray[Any]":
+    """Convert a column to float64, turning values that are not numbers into nulls."""
+    if pa.types.is_string(column.type):
+        column = pc.utf8_trim_whitespace(column)
+        column = pc.if_else(
+            pc.match_substring_regex(column, _NUMBER_PATTERN),
+            column,
+            pa.scalar(None, pa.string()),
+        )
+    return pc.cast(column, pa.float64())
+
+
+def _value_counts(
+    column: "pa.ChunkedArray[Any]", limit: int
+) -> list[tuple[object, int]]:
+    """Count the distinct non-null values of a column, most frequent first."""
+    counts = pa.Table.from_struct_array(pc.value_counts(column.drop_null()))
+    top = counts.sort_by([("counts", "descending")]).slice(0, limit)
+    # The counts column is never null, though to_pylist() is typed as if it could be
+    return list(zip(top["values"].to_pylist(), top["counts"].to_pylist()))  # pyright: ignore[reportReturnType]
+
+
+def _to_csv(table: pa.Table) -> str:
+    """Serialize a table to a CSV string, including the header row."""
+    output = io.BytesIO()
+    pa_csv.write_csv(table, output)
+    return output.getvalue().decode()
+
+
+class PortfolioData:
+    """
+    Portfolio CSV as returned by the API, decoded and parsed on first access.
+    """
+
+    def __init__(self, content: bytearray, encoding: str):
+        self.content = content
+        self.encoding = encoding
+
+    @cached_property
+    def csv(self) -> str:
+        """The CSV data decoded to a string."""
+        return self.content.decode(self.encoding)
+
+    @cached_property
+    def table(self) -> pa.Table:
+        """The CSV data parsed into an Arrow table, with empty fields as nulls."""
+        # read_csv accepts buffers, though the stubs only list paths and files
+        return pa_csv.read_csv(
+            pa.py_buffer(self.content),  # pyright: ignore[reportArgumentType]
+            convert_options=pa_csv.ConvertOptions(strings_can_be_null=True),
+        )
 
 
 class PortfolioResourceProvider:
@@ -20,8 +86,17 @@ class PortfolioResourceProvider:
     inspected by LLM clients.
     """
 
-    def __init__(self, mcp: FastMCP):
+    def __init__(self, mcp: FastMCP, http_client: HttpClientHolder):
         self.mcp = mcp
+        self._client = http_client
+        # Settings are fixed for the process, so the upstream URL is built once
+        self._csv_url = f"{get_settings().portfolio_api_url_str}portfolio/csv"
+        self._cache = TTLCache[str, PortfolioData](
+            maxsize=CACHE_SIZE, ttl=CACHE_TTL_SECONDS
+        )
+        self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
         self.register_resources()
 
     def register_resources(self):
@@ -47,29 +122,61 @@ class PortfolioResourceProvider:
             mime_type="text/markdown",
         )(self.get_portfolio_summary)
 
-    async def _fetch_portfolio_data(self) -> str:
+    async def _fetch_portfolio_data(self, token: str) -> PortfolioData:
         """
         Fetch portfolio CSV data from the API.
 
+        The response body is streamed into a single buffer that is handed to the
+        CSV reader as is, without an intermediate decoded copy.
+
         Args:
-            access_token: Optional bearer token for authentication
+            token: Bearer token for authentication
 
         Returns:
-            CSV string data
+            PortfolioData wrapping the CSV bytes
         """
-        access_token = get_access_token()
+        async with self._client.client.stream(
+            "GET",
+            self._csv_url,
+            headers={"Authorization": f"Bearer {token}"},
+        ) as response:
+            response.raise_for_status()
+
+            content = bytearray()
+            async for chunk in response.aiter_bytes():
+                content += chunk
+
+            return PortfolioData(content, response.encoding or "utf-8")
+
+    async def _load_portfolio_data(self) -> PortfolioData:
+        """
+        Get the portfolio data for the current access token.
+
+        Responses are cached per token for a short time so that reading several
+        portfolio resources in a row only downloads and parses the CSV once.
+        Concurrent reads for the same token wait for a single fetch.
+
+        Returns:
+            PortfolioData for the current user
+        """
+        access_token = get_cached_access_token()
 
         if access_token is None:
             raise ValueError("No access token found")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{settings.portfolio_api_url}portfolio/csv",
-                headers={"Authorization": f"Bearer {access_token}"},
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            return response.text
+        key = hashlib.blake2s(access_token.token.encode()).hexdigest()
+
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+
+        async with lock:
+            data = self._cache.get(key)
+            if data is None:
+                data = await self._fetch_portfolio_data(access_token.token)
+                self._cache[key] = data
+
+        return data
 
     async def get_portfolio_csv_raw(self) -> str:
         """
@@ -82,8 +189,8 @@ class PortfolioResourceProvider:
             CSV string data
         """
         try:
-            csv_data = await self._fetch_portfolio_data()
-            return csv_data
+            data = await self._load_portfolio_data()
+            return data.csv
         except Exception as e:
             raise ResourceError(f"Error loading portfolio data: {str(e)}")
 
@@ -98,25 +205,18 @@ class PortfolioResourceProvider:
             CSV string with filtered portfolio data for the PM
         """
         try:
-            csv_data = await self._fetch_portfolio_data()
-            df = pd.read_csv(io.StringIO(csv_data))  # pyright: ignore[reportUnknownMemberType]
+            table = (await self._load_portfolio_data()).table
 
             # Filter by PM
-            if "PM" not in df.columns:
+            if "PM" not in table.column_names:
                 raise ResourceError("PM column not found in portfolio data")
 
-            pm_df = df[df["PM"] == pm]
-
-            if pm_df.empty:
-                # Return empty CSV with headers for consistency
-                output = io.StringIO()
-                pd.DataFrame(columns=df.columns).to_csv(output, index=False)
-                return output.getvalue()
+            pm_table = table.filter(
+                pc.equal(pc.cast(table["PM"], pa.string()), pa.scalar(pm))
+            )
 
-            # Convert back to CSV
-            output = io.StringIO()
-            pm_df.to_csv(output, index=False)
-            return output.getvalue()
+            # Convert back to CSV (an empty result still contains the header row)
+            return _to_csv(pm_table)
 
         except ResourceError:
             raise
@@ -137,20 +237,19 @@ class PortfolioResourceProvider:
             Markdown string containing portfolio summary
         """
         try:
-            csv_data = await self._fetch_portfolio_data()
-            df = pd.read_csv(io.StringIO(csv_data))  # pyright: ignore[reportUnknownMemberType]
+            table = (await self._load_portfolio_data()).table
 
             summary_lines: list[str] = []
             summary_lines.append("# Portfolio Summary\n")
 
             # Basic statistics
-            summary_lines.append(f"**Total Positions:** {len(df)}")
+            summary_lines.append(f"**Total Positions:** {table.num_rows}")
 
-            if "PM" in df.columns:
-                unique_pms = df["PM"].dropna().unique()
+            if "PM" in table.column_names:
+                unique_pms = pc.unique(table["PM"].drop_null())
                 summary_lines.append(f"**Number of PMs:** {len(unique_pms)}")
                 summary_lines.append(
-                    f"**PM List:** {', '.join(sorted(unique_pms[:10]))}"
+                    f"**PM List:** {', '.join(sorted(map(str, unique_pms[:10].to_pylist())))}"
                 )
                 if len(unique_pms) > 10:
                     summary_lines.append(f"  ... and {len(unique_pms) - 10} more")
@@ -167,27 +266,43 @@ class PortfolioResourceProvider:
                 ("YTDPnL", "Total YTD P&L"),
             ]
 
-            for col, label in metrics_to_sum:
-                if col in df.columns:
-                    value = pd.to_numeric(df[col], errors="coerce").sum()  # pyright: ignore[reportUnknownMemberType, reportAny]
-                    summary_lines.append(f"- **{label}:** ${value:,.2f}")
+            metric_columns = {
+                col: _to_numeric(table[col])
+                for col, _ in metrics_to_sum
+                if col in table.column_names
+            }
+
+            if metric_columns:
+                # Sum all metric columns in a single aggregation
+                totals = (
+                    pa.Table.from_pydict(metric_columns)
+                    .group_by([])
+                    .aggregate([(col, "sum") for col in metric_columns])
+                    .to_pylist()[0]
+                )
+                for col, label in metrics_to_sum:
+                    if col in metric_columns:
+                        value = totals[f"{col}_sum"] or 0.0
+                        summary_lines.append(f"- **{label}:** ${value:,.2f}")
 
             summary_lines.append("")
 
             # Asset class breakdown
-            if "InstClass" in df.columns:
+            if "InstClass" in table.column_names:
                 summary_lines.append("## Asset Class Breakdown")
-                asset_counts = df["InstClass"].value_counts()
-                for asset_class, count in asset_counts.head(10).items():
+                for asset_class, count in _value_counts(table["InstClass"], 10):
                     summary_lines.append(f"- {asset_class}: {count} positions")
 
             # Underlying instruments
-            if "UnderlyingInstrument" in df.columns:
+            if "UnderlyingInstrument" in table.column_names:
                 summary_lines.append("\n## Top Underlying Instruments")
-                underlying_counts = df["UnderlyingInstrument"].value_counts()
-                for underlying, count in underlying_counts.head(10).items():
-                    if underlying and str(underlying).strip():
-                        summary_lines.append(f"- {underlying}: {count} positions")
+                underlying = table["UnderlyingInstrument"]
+                if pa.types.is_string(underlying.type):
+                    underlying = underlying.filter(
+                        pc.not_equal(pc.utf8_trim_whitespace(underlying), pa.scalar(""))
+                    )
+                for instrument, count in _value_counts(underlying, 10):
+                    summary_lines.append(f"- {instrument}: {count} positions")
 
             return "\n".join(summary_lines)
 
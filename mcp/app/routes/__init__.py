@@ -3,6 +3,9 @@ MCP Routes module.
 """
 
 from fastmcp import FastMCP
+from app.routes.health import HealthCheckMiddleware, register_health_routes
+
+__all__ = ["HealthCheckMiddleware", "register_routes"]
 
 
 def register_routes(mcp: FastMCP) -> None:
@@ -12,6 +15,4 @@ def register_routes(mcp: FastMCP) -> None:
     Args:
         mcp: The FastMCP server instance
     """
-    from app.routes.health import register_health_routes
-
     register_health_routes(mcp)
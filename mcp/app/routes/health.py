@@ -2,19 +2,67 @@
 Health check routes for the FastMCP server.
 """
 
+from typing import Final
 from fastmcp import FastMCP
-from starlette.requests import Request
-from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Pre-built ASGI messages, sent as-is on every request
+_START: Final[Message] = {
+    "type": "http.response.start",
+    "status": 200,
+    "headers": [
+        (b"content-type", b"text/plain; charset=utf-8"),
+        (b"content-length", b"2"),
+    ],
+}
+_BODY: Final[Message] = {
+    "type": "http.response.body",
+    "body": b"OK",
+    "more_body": False,
+}
+
+
+class _HealthCheck:
+    """
+    Health check endpoint to verify server is running.
+
+    A raw ASGI app rather than a request handler, so Starlette mounts it
+    directly and no Request or Response objects are built per probe.
+    """
+
+    async def __call__(self, _scope: Scope, _receive: Receive, send: Send) -> None:
+        await send(_START)
+        await send(_BODY)
+
+
+_health_check = _HealthCheck()
+
+
+class HealthCheckMiddleware:
+    """
+    ASGI middleware that answers health checks before the request is routed.
+
+    Starlette matches routes in order, and FastMCP appends custom routes after
+    its MCP and OAuth routes. Handling GET /health here keeps probes from walking
+    that list. Other requests are passed through unchanged.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] == "http"
+            and scope["path"] == "/health"
+            and scope["method"] == "GET"
+        ):
+            await _health_check(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
 
 
 def register_health_routes(mcp: FastMCP) -> None:
     """
     Register health check routes.
     """
-
-    @mcp.custom_route("/health", methods=["GET"])
-    async def health_check(_request: Request) -> PlainTextResponse:  # pyright: ignore[reportUnusedFunction]
-        """
-        Health check endpoint to verify server is running.
-        """
-        return PlainTextResponse("OK")
+    mcp.custom_route("/health", methods=["GET"])(_health_check)  # pyright: ignore[reportArgumentType]
@@ -2,9 +2,26 @@
 FastMCP server instance and configuration.
 """
 
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import anyio
+import httpx
 from fastmcp import FastMCP
 from app.auth.setup import setup_auth
-from app.middleware import AuthorizationMiddleware, RoleBasedVerifier
+from app.config import get_settings
+from app.http_client import HttpClientHolder
+from app.middleware import (
+    AuthorizationMiddleware,
+    RoleBasedVerifier,
+    get_tag_requirements,
+)
+from app.resources import register_resources
+from app.routes import register_routes
+from app.tools import register_tools
+from app.tools.sandbox import close_sandbox_pool
 
 
 def create_server() -> FastMCP:
@@ -14,21 +31,55 @@ def create_server() -> FastMCP:
     Returns:
         FastMCP: Configured FastMCP server instance
     """
+    settings = get_settings()
+
+    def create_http_client() -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(
+                connect=settings.http_connect_timeout,
+                read=settings.http_read_timeout,
+                write=settings.http_write_timeout,
+                pool=settings.http_pool_timeout,
+            ),
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive,
+                keepalive_expiry=settings.http_keepalive_expiry,
+            ),
+        )
+
+    # Shared by all upstream calls so connections are pooled and reused; the
+    # client itself only exists while the lifespan is running
+    http_client = HttpClientHolder(create_http_client)
+
+    @asynccontextmanager
+    async def lifespan(server: FastMCP) -> AsyncIterator[dict[str, Any]]:  # pyright: ignore[reportExplicitAny]
+        # Parse tool tag requirements once at startup instead of on the first listing
+        for tool in (await server.get_tools()).values():
+            get_tag_requirements(tool)
+
+        try:
+            async with http_client.open():
+                yield {}
+        finally:
+            # Shielded: the lifespan is often torn down from a cancelled scope,
+            # and an interrupted exit leaves FastMCP thinking it is still running
+            with anyio.CancelScope(shield=True):
+                await asyncio.to_thread(close_sandbox_pool)
+
     auth_provider = setup_auth()
     mcp = FastMCP(
         name="FastMCP Playground",
         auth=auth_provider,
         include_fastmcp_meta=False,
+        lifespan=lifespan,
     )
 
     mcp.add_middleware(AuthorizationMiddleware(RoleBasedVerifier()))
 
-    from app.tools import register_tools
-    from app.routes import register_routes
-    from app.resources import register_resources
-
     register_tools(mcp)
     register_routes(mcp)
-    register_resources(mcp)
+    register_resources(mcp, http_client)
 
     return mcp
@@ -3,16 +3,13 @@ MCP Tools module.
 """
 
 from fastmcp import FastMCP
+from app.tools import auth, portfolio, sandbox
 
 
 def register_tools(mcp: FastMCP) -> None:
     """
-    Register all tool providers with the FastMCP server.
+    Register all tools with the FastMCP server.
     """
-    from app.tools.auth import AuthToolProvider
-    from app.tools.portfolio import PortfolioToolProvider
-    from app.tools.sandbox import SandboxToolProvider
-
-    AuthToolProvider(mcp)
-    PortfolioToolProvider(mcp)
-    SandboxToolProvider(mcp)
+    auth.register(mcp)
+    portfolio.register(mcp)
+    sandbox.register(mcp)
@@ -2,55 +2,57 @@
 Authentication-related demo tools.
 """
 
-from typing import Any, override
+from typing import Any, Final
 from fastmcp import FastMCP
-from mcp.types import ToolAnnotations
-from fastmcp.server.dependencies import get_access_token
-from app.tools.base import BaseToolProvider
+from mcp.types import Icon, ToolAnnotations
+from app.auth.context import get_cached_access_token
 from app.icons import key_square
 
+# Shared responses for the unauthenticated and no-claims cases; never mutated
+_NOT_AUTHENTICATED: Final[dict[str, Any]] = {"error": "Not authenticated"}  # pyright: ignore[reportExplicitAny]
+_EMPTY_CLAIMS: Final[dict[str, Any]] = {}  # pyright: ignore[reportExplicitAny]
 
-class AuthToolProvider(BaseToolProvider):
+
+# Tool metadata, validated once and reused by every registration
+_TOKEN_CLAIMS_TAGS: Final[set[str]] = {"role:all"}
+_TOKEN_CLAIMS_ICONS: Final[list[Icon]] = [key_square]
+_TOKEN_CLAIMS_ANNOTATIONS: Final = ToolAnnotations(
+    title="Get Token Claims",
+    readOnlyHint=True,
+    destructiveHint=False,
+    idempotentHint=True,
+    openWorldHint=False,
+)
+_TOKEN_CLAIMS_META: Final[dict[str, Any]] = {  # pyright: ignore[reportExplicitAny]
+    "unique.app/system-prompt": "Use this tool to get the JWT claims from the current access token, e.g. to determine the groups a user is a member of.",
+}
+
+
+def get_token_claims() -> dict[str, Any]:  # pyright: ignore[reportExplicitAny]
     """
-    Provider for authentication-related tools.
+    Get the JWT claims from the current access token.
 
-    This demonstrates how a class can share common authentication
-    logic across multiple tools.
+    Returns:
+        Dictionary containing JWT claims or error message
     """
+    token = get_cached_access_token()
+
+    if token is None:
+        return _NOT_AUTHENTICATED
 
-    def __init__(self, mcp: FastMCP):
-        super().__init__(mcp)
-
-    @override
-    def register_tools(self):
-        self.mcp.tool(
-            name="get_token_claims",
-            title="Get Token Claims",
-            description="Get the JWT claims from the current access token.",
-            tags={"role:all"},
-            icons=[key_square],
-            annotations=ToolAnnotations(
-                title="Get Token Claims",
-                readOnlyHint=True,
-                destructiveHint=False,
-                idempotentHint=True,
-                openWorldHint=False,
-            ),
-            meta={
-                "unique.app/system-prompt": "Use this tool to get the JWT claims from the current access token, e.g. to determine the groups a user is a member of.",
-            },
-        )(self.get_token_claims)
-
-    def get_token_claims(self) -> dict[str, Any]:  # pyright: ignore[reportExplicitAny]
-        """
-        Get the JWT claims from the current access token.
-
-        Returns:
-            Dictionary containing JWT claims or error message
-        """
-        token = get_access_token()
-
-        if token is None:
-            return {"error": "Not authenticated"}
-
-        return token.claims or {}
+    return token.claims if token.claims else _EMPTY_CLAIMS
+
+
+def register(mcp: FastMCP) -> None:
+    """
+    Register the authentication-related tools with the FastMCP server.
+    """
+    mcp.tool(
+        name="get_token_claims",
+        title="Get Token Claims",
+        description="Get the JWT claims from the current access token.",
+        tags=_TOKEN_CLAIMS_TAGS,
+        icons=_TOKEN_CLAIMS_ICONS,
+        annotations=_TOKEN_CLAIMS_ANNOTATIONS,
+        meta=_TOKEN_CLAIMS_META,
+    )(get_token_claims)
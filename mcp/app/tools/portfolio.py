@@ -4,66 +4,117 @@ Portfolio-related tools.
 This module provides tools for accessing portfolio insights and data.
 """
 
-from typing import Any, override
+from typing import Any, Final
 from fastmcp import FastMCP
-from mcp.types import ToolAnnotations
-from app.tools.base import BaseToolProvider
+from mcp.types import Icon, ToolAnnotations
+from pydantic import BaseModel, ConfigDict
 from app.icons import notebook_tabs
 
 
-class PortfolioToolProvider(BaseToolProvider):
+class PortfolioPerformance(BaseModel):
+    """Portfolio value change over several periods, in percent."""
+
+    model_config = ConfigDict(frozen=True)
+
+    daily_change: float
+    weekly_change: float
+    monthly_change: float
+    yearly_change: float
+
+
+class PortfolioHolding(BaseModel):
+    """A single position among the largest holdings."""
+
+    model_config = ConfigDict(frozen=True)
+
+    symbol: str
+    value: float
+    percentage: float
+
+
+class AssetAllocation(BaseModel):
+    """Share of the portfolio per asset class, in percent."""
+
+    model_config = ConfigDict(frozen=True)
+
+    stocks: float
+    bonds: float
+    cash: float
+
+
+class PortfolioInsights(BaseModel):
+    """Insights about a user's portfolio."""
+
+    model_config = ConfigDict(frozen=True)
+
+    total_value: float
+    currency: str
+    asset_count: int
+    performance: PortfolioPerformance
+    risk_level: str
+    top_holdings: tuple[PortfolioHolding, ...]
+    asset_allocation: AssetAllocation
+
+
+# Static sample insights, validated once and shared by every call
+_PORTFOLIO_INSIGHTS: Final = PortfolioInsights(
+    total_value=125000.00,
+    currency="USD",
+    asset_count=15,
+    performance=PortfolioPerformance(
+        daily_change=1.2,
+        weekly_change=3.5,
+        monthly_change=8.7,
+        yearly_change=22.3,
+    ),
+    risk_level="moderate",
+    top_holdings=(
+        PortfolioHolding(symbol="AAPL", value=25000.00, percentage=20.0),
+        PortfolioHolding(symbol="GOOGL", value=18750.00, percentage=15.0),
+        PortfolioHolding(symbol="MSFT", value=15625.00, percentage=12.5),
+    ),
+    asset_allocation=AssetAllocation(
+        stocks=70.0,
+        bonds=20.0,
+        cash=10.0,
+    ),
+)
+
+
+# Registration metadata for portfolio_insights
+_INSIGHTS_TAGS: Final[set[str]] = {"role:portfolio_access"}
+_INSIGHTS_ICONS: Final[list[Icon]] = [notebook_tabs]
+_INSIGHTS_ANNOTATIONS: Final = ToolAnnotations(
+    title="Portfolio Insights",
+    readOnlyHint=True,
+    destructiveHint=False,
+    idempotentHint=True,
+    openWorldHint=True,
+)
+_INSIGHTS_META: Final[dict[str, Any]] = {  # pyright: ignore[reportExplicitAny]
+    "unique.app/system-prompt": "Use this tool to get insights about the user's portfolio.",
+}
+
+
+def portfolio_insights() -> PortfolioInsights:
     """
-    Provider for portfolio-related tools.
+    Get insights about the user's portfolio.
     """
+    # In a real implementation, this would fetch actual portfolio data
+    # For now, return sample insights
+    return _PORTFOLIO_INSIGHTS
+
 
-    def __init__(self, mcp: FastMCP):
-        super().__init__(mcp)
-
-    @override
-    def register_tools(self):
-        self.mcp.tool(
-            name="portfolio_insights",
-            title="Portfolio Insights",
-            description="Get insights about the user's portfolio.",
-            tags={"role:portfolio_access"},
-            icons=[notebook_tabs],
-            annotations=ToolAnnotations(
-                title="Portfolio Insights",
-                readOnlyHint=True,
-                destructiveHint=False,
-                idempotentHint=True,
-                openWorldHint=True
-            ),
-            meta={
-                "unique.app/system-prompt": "Use this tool to get insights about the user's portfolio.",
-            },
-        )(self.portfolio_insights)
-
-    def portfolio_insights(self) -> dict[str, Any]:  # pyright: ignore[reportExplicitAny]
-        """
-        Get insights about the user's portfolio.
-        """
-        # In a real implementation, this would fetch actual portfolio data
-        # For now, return sample insights
-        return {
-            "total_value": 125000.00,
-            "currency": "USD",
-            "asset_count": 15,
-            "performance": {
-                "daily_change": 1.2,
-                "weekly_change": 3.5,
-                "monthly_change": 8.7,
-                "yearly_change": 22.3,
-            },
-            "risk_level": "moderate",
-            "top_holdings": [
-                {"symbol": "AAPL", "value": 25000.00, "percentage": 20.0},
-                {"symbol": "GOOGL", "value": 18750.00, "percentage": 15.0},
-                {"symbol": "MSFT", "value": 15625.00, "percentage": 12.5},
-            ],
-            "asset_allocation": {
-                "stocks": 70.0,
-                "bonds": 20.0,
-                "cash": 10.0,
-            },
-        }
+def register(mcp: FastMCP) -> None:
+    """
+    Register the portfolio tools with the FastMCP server.
+    """
+    mcp.tool(
+        name="portfolio_insights",
+        title="Portfolio Insights",
+        description="Get insights about the user's portfolio.",
+        tags=_INSIGHTS_TAGS,
+        icons=_INSIGHTS_ICONS,
+        annotations=_INSIGHTS_ANNOTATIONS,
+        meta=_INSIGHTS_META,
+    )(portfolio_insights)
@@ -2,79 +2,227 @@
 Sandbox tool for executing Python code in an isolated environment.
 
 This module provides tools for securely running Python code using llm-sandbox.
+Containers are taken from a shared warm pool instead of being started per call.
 """
 
-from typing import Any, override
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Final
 from fastmcp import FastMCP
-from llm_sandbox import SandboxBackend  # pyright: ignore[reportMissingTypeStubs]
-from mcp.types import ToolAnnotations
-from app.tools.base import BaseToolProvider
+from llm_sandbox import SandboxBackend, SandboxSession  # pyright: ignore[reportMissingTypeStubs]
+from llm_sandbox.pool import ContainerPoolManager, PoolConfig, create_pool_manager  # pyright: ignore[reportMissingTypeStubs]
+from mcp.types import Icon, ToolAnnotations
+from app.config import get_settings
+from app.config.settings import SandboxBackendType
 from app.icons import code
 
 
-class SandboxToolProvider(BaseToolProvider):
-    """
-    Provider for code execution sandbox tools.
-    """
-
-    def __init__(self, mcp: FastMCP):
-        super().__init__(mcp)
-
-    @override
-    def register_tools(self):
-        self.mcp.tool(
-            name="run_python_code",
-            title="Run Python Code",
-            description="Run Python code in a secure sandbox environment.",
-            tags={"role:all"},
-            icons=[code],
-            annotations=ToolAnnotations(
-                title="Run Python Code",
-                readOnlyHint=False,
-                destructiveHint=False,
-                idempotentHint=True,
-                openWorldHint=True,
-            ),
-            meta={
-                "unique.app/system-prompt": "Use this tool to run Python code in a secure sandbox environment.",
-            },
-        )(self.run_python_code)
-
-    def run_python_code(self, code: str, timeout: int = 30) -> dict[str, Any]:  # pyright: ignore[reportExplicitAny]
-        """
-        Execute Python code in a secure sandbox environment.
-
-        Args:
-            code: The Python code to execute
-            timeout: Maximum execution time in seconds (default: 30)
-
-        Returns:
-            A dictionary containing:
-            - stdout: Standard output from the code execution
-            - stderr: Standard error from the code execution
-            - exit_code: Exit code of the execution (0 for success)
-            - success: Boolean indicating if execution was successful
-        """
-        try:
-            from llm_sandbox import SandboxSession  # pyright: ignore[reportMissingTypeStubs]
-
-            with SandboxSession(
-                lang="python",
-                backend=SandboxBackend.DOCKER,
-            ) as session:
-                result = session.run(code, timeout=timeout)  # pyright: ignore[reportUnknownMemberType]
-
-                return {
-                    "stdout": result.stdout or "",
-                    "stderr": result.stderr or "",
-                    "exit_code": result.exit_code,
-                    "success": result.exit_code == 0,
+logger = logging.getLogger(__name__)
+
+# Returned for any failure to run the code; details go to the server log
+_ERROR_RESPONSE: Final[dict[str, Any]] = {  # pyright: ignore[reportExplicitAny]
+    "stdout": "",
+    "stderr": "Error executing code",
+    "exit_code": 1,
+    "success": False,
+}
+
+_pool: ContainerPoolManager | None = None
+_executor: ThreadPoolExecutor | None = None
+_release_executor: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def get_sandbox_pool() -> ContainerPoolManager:
+    """
+    Get the shared sandbox container pool, creating it on first use.
+
+    The pool keeps pre-started containers ready so calls do not wait for a
+    container to boot. Each container runs a single call and is destroyed on
+    release, so files and processes left behind by one caller never reach the
+    next. llm-sandbox boots the replacement inside release(), so containers are
+    released off the request path (see _release_session).
+    """
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            settings = get_settings()
+            backend_kwargs: dict[str, Any] = {}  # pyright: ignore[reportExplicitAny]
+            if (
+                settings.sandbox_runtime
+                and settings.sandbox_backend != SandboxBackendType.KUBERNETES
+            ):
+                backend_kwargs["runtime_configs"] = {
+                    "runtime": settings.sandbox_runtime
                 }
 
-        except Exception as e:
-            return {
-                "stdout": "",
-                "stderr": f"Error executing code: {str(e)}",
-                "exit_code": 1,
-                "success": False,
-            }
+            _pool = create_pool_manager(
+                backend=SandboxBackend(settings.sandbox_backend.value),
+                config=PoolConfig(
+                    max_pool_size=settings.sandbox_pool_size,
+                    # Keep a warm container for every execution that may run at once
+                    min_pool_size=min(
+                        settings.sandbox_concurrency, settings.sandbox_pool_size
+                    ),
+                    idle_timeout=settings.sandbox_idle_timeout,
+                    # Never hand a used container to another caller
+                    max_container_uses=1,
+                ),
+                lang="python",
+                **backend_kwargs,
+            )
+        return _pool
+
+
+def get_sandbox_executor() -> ThreadPoolExecutor:
+    """
+    Get the thread pool that blocking sandbox calls run on, creating it on first use.
+
+    Its size caps how many executions run at once, so a burst of calls queues up
+    here instead of starting more containers than the host can hold. Runs in
+    separate containers proceed in parallel, but taking a container from the
+    pool does not: llm-sandbox serializes acquire() and release() on one lock,
+    and a replacement container boots while holding it.
+    """
+    global _executor
+
+    with _pool_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=get_settings().sandbox_concurrency,
+                thread_name_prefix="sandbox",
+            )
+        return _executor
+
+
+def _get_release_executor() -> ThreadPoolExecutor:
+    """
+    Get the thread that used containers are released on, creating it on first use.
+
+    One worker is enough: llm-sandbox destroys and replaces containers while
+    holding its pool lock, so releases run one at a time either way.
+    """
+    global _release_executor
+
+    with _pool_lock:
+        if _release_executor is None:
+            _release_executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="sandbox-release",
+            )
+        return _release_executor
+
+
+def close_sandbox_pool() -> None:
+    """
+    Shut down the shared sandbox executors and container pool, if they were created.
+    """
+    global _pool, _executor, _release_executor
+
+    with _pool_lock:
+        executor, _executor = _executor, None
+
+    # Outside the lock: running calls may still need it to reach the pool
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    with _pool_lock:
+        release_executor, _release_executor = _release_executor, None
+
+    # Pending releases are not cancelled, so every container goes back to the pool
+    if release_executor is not None:
+        release_executor.shutdown(wait=True)
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+# Registration metadata for run_python_code
+_RUN_CODE_TAGS: Final[set[str]] = {"role:all"}
+_RUN_CODE_ICONS: Final[list[Icon]] = [code]
+_RUN_CODE_ANNOTATIONS: Final = ToolAnnotations(
+    title="Run Python Code",
+    readOnlyHint=False,
+    destructiveHint=False,
+    idempotentHint=True,
+    openWorldHint=True,
+)
+_RUN_CODE_META: Final[dict[str, Any]] = {  # pyright: ignore[reportExplicitAny]
+    "unique.app/system-prompt": "Use this tool to run Python code in a secure sandbox environment.",
+}
+
+
+async def run_python_code(code: str, timeout: int = 30) -> dict[str, Any]:  # pyright: ignore[reportExplicitAny]
+    """
+    Execute Python code in a secure sandbox environment.
+
+    Args:
+        code: The Python code to execute
+        timeout: Maximum execution time in seconds (default: 30)
+
+    Returns:
+        A dictionary containing:
+        - stdout: Standard output from the code execution
+        - stderr: Standard error from the code execution
+        - exit_code: Exit code of the execution (0 for success)
+        - success: Boolean indicating if execution was successful
+    """
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_sandbox_executor(), _run_in_pool, code, timeout
+        )
+
+    except Exception:
+        logger.exception("Sandbox code execution failed")
+        return _ERROR_RESPONSE
+
+
+def _run_in_pool(code: str, timeout: int) -> dict[str, Any]:  # pyright: ignore[reportExplicitAny]
+    """
+    Run code in a fresh pooled container. Blocks, so it is called off the event loop.
+    """
+    session = SandboxSession(pool=get_sandbox_pool(), lang="python")
+    session.open()
+    try:
+        result = session.run(code, timeout=timeout)  # pyright: ignore[reportUnknownMemberType]
+
+        return {
+            "stdout": result.stdout or "",
+            "stderr": result.stderr or "",
+            "exit_code": result.exit_code,
+            "success": result.exit_code == 0,
+        }
+    finally:
+        # The result does not wait for the used container to be replaced
+        _get_release_executor().submit(_release_session, session)
+
+
+def _release_session(session: Any) -> None:  # pyright: ignore[reportExplicitAny]
+    """
+    Return a session's container to the pool, which destroys and replaces it.
+    """
+    try:
+        session.close()
+    except Exception:
+        logger.exception("Failed to release sandbox container")
+
+
+def register(mcp: FastMCP) -> None:
+    """
+    Register the sandbox tools with the FastMCP server.
+    """
+    mcp.tool(
+        name="run_python_code",
+        title="Run Python Code",
+        description="Run Python code in a secure sandbox environment.",
+        tags=_RUN_CODE_TAGS,
+        icons=_RUN_CODE_ICONS,
+        annotations=_RUN_CODE_ANNOTATIONS,
+        meta=_RUN_CODE_META,
+    )(run_python_code)
@@ -4,14 +4,41 @@ FastMCP Playground - Entry Point
 This is the main entry point for the FastMCP playground server.
 """
 
+import sys
+from functools import partial
+
+import anyio
+from starlette.middleware import Middleware
 from app.server import create_server
-from app.config.settings import settings
+from app.config import get_settings
+from app.config.settings import Environment
+from app.routes import HealthCheckMiddleware
 
 
 def main():
     """Run the FastMCP server."""
+    settings = get_settings()
     mcp = create_server()
-    mcp.run(transport="http", port=settings.port, host=settings.host)
+
+    # mcp.run() always starts a default asyncio loop and uvicorn's own `loop`
+    # option is ignored when FastMCP drives the server, so the loop is started
+    # here to run on uvloop (not available on Windows)
+    anyio.run(
+        partial(
+            mcp.run_async,
+            "http",
+            port=settings.port,
+            host=settings.host,
+            # Answer health probes before routing
+            middleware=[Middleware(HealthCheckMiddleware)],
+            uvicorn_config={
+                "http": "httptools",
+                # Skip per-request access log formatting in production
+                "access_log": settings.python_env != Environment.PRODUCTION,
+            },
+        ),
+        backend_options={"use_uvloop": sys.platform != "win32"},
+    )
 
 
 if __name__ == "__main__":
@@ -5,10 +5,11 @@ Requires JWT Bearer token (demo - no validation).
 
 import csv
 import io
-import json
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Annotated
 
+import orjson
 from fastapi import FastAPI, Header, HTTPException, status
 from fastapi.responses import StreamingResponse
 
@@ -17,11 +18,49 @@ app = FastAPI(title="Portfolio API", version="0.1.0")
 # Path to the sample data
 DATA_FILE = Path(__file__).parent / "data" / "sample-data.json"
 
+# Approximate size of each chunk written to the CSV response
+CSV_CHUNK_SIZE = 64 * 1024
+
+# Parsed portfolio data, keyed by the data file's modification time and size
+_data_cache: tuple[int, int, list[dict]] | None = None
+
 
 def load_portfolio_data() -> list[dict]:
-    """Load portfolio data from JSON file."""
-    with open(DATA_FILE, "r") as f:
-        return json.load(f)
+    """
+    Load portfolio data from JSON file.
+
+    The parsed data is kept in memory and only re-read when the file changes.
+    """
+    global _data_cache
+
+    stat = DATA_FILE.stat()
+    if _data_cache is not None and _data_cache[:2] == (stat.st_mtime_ns, stat.st_size):
+        return _data_cache[2]
+
+    data = orjson.loads(DATA_FILE.read_bytes())
+    _data_cache = (stat.st_mtime_ns, stat.st_size, data)
+    return data
+
+
+async def iter_csv(data: list[dict]) -> AsyncIterator[bytes]:
+    """
+    Encode portfolio records as CSV, yielding roughly CSV_CHUNK_SIZE bytes at a time.
+
+    Field names are taken from the first record.
+    """
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=list(data[0].keys()))
+    writer.writeheader()
+
+    for row in data:
+        writer.writerow(row)
+        if output.tell() >= CSV_CHUNK_SIZE:
+            yield output.getvalue().encode()
+            output.seek(0)
+            output.truncate()
+
+    if output.tell():
+        yield output.getvalue().encode()
 
 
 def check_jwt_bearer(authorization: str | None) -> None:
@@ -43,8 +82,9 @@ def check_jwt_bearer(authorization: str | None) -> None:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    token = authorization[7:].strip()
-    if not token:
+    # The token follows the single space after the scheme; a blank there means
+    # no token, so there is no need to slice and strip the header
+    if len(authorization) == 7 or authorization[7].isspace():
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Missing JWT token",
@@ -86,22 +126,9 @@ async def get_portfolio_csv(authorization: Annotated[str | None, Header()] = Non
             status_code=status.HTTP_404_NOT_FOUND, detail="No portfolio data available"
         )
 
-    # Create CSV in memory
-    output = io.StringIO()
-
-    # Get all field names from the first record
-    fieldnames = list(data[0].keys())
-
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
-    writer.writeheader()
-    writer.writerows(data)
-
-    # Get CSV content
-    csv_content = output.getvalue()
-
-    # Return as streaming response
+    # Stream the CSV as it is written instead of building it in memory first
     return StreamingResponse(
-        iter([csv_content]),
+        iter_csv(data),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=portfolio-data.csv"},
     )